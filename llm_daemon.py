@@ -0,0 +1,110 @@
+# llm_daemon.py — long-lived LLM process: load the GGUF once, serve generations over a UNIX socket
+from __future__ import annotations
+import argparse
+import json
+import os
+import socketserver
+import sys
+
+DEFAULT_SOCKET_PATH = "/tmp/vesper_llm.sock"
+
+
+class _GenerateHandler(socketserver.StreamRequestHandler):
+    """One JSON request per line in, one or more JSON replies per line out.
+
+    Request:  {"prompt": str, "max_tokens": int, "temperature": float,
+               "top_p": float, "stream": bool}
+    Reply:    {"text": str}  or  {"error": str}
+    Streamed: {"text": piece} per decoded piece, then {"done": true}
+    """
+
+    def handle(self):
+        for line in self.rfile:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                req = json.loads(line)
+                kwargs = dict(
+                    prompt=req["prompt"],
+                    max_tokens=int(req.get("max_tokens", 256)),
+                    temperature=float(req.get("temperature", 0.7)),
+                    top_p=float(req.get("top_p", 0.95)),
+                    top_k=int(req.get("top_k", 40)),
+                    min_p=float(req.get("min_p", 0.05)),
+                    repeat_penalty=float(req.get("repeat_penalty", 1.1)),
+                    stop=req.get("stop"),
+                )
+                if req.get("stream"):
+                    for chunk in self.server.llm(stream=True, **kwargs):
+                        piece = chunk["choices"][0]["text"]
+                        if piece:
+                            self._reply({"text": piece})
+                    self._reply({"done": True})
+                    continue
+                result = self.server.llm(**kwargs)
+                reply = {"text": result["choices"][0]["text"]}
+            except Exception as e:
+                reply = {"error": str(e)}
+            self._reply(reply)
+
+    def _reply(self, obj) -> None:
+        self.wfile.write((json.dumps(obj) + "\n").encode("utf-8"))
+        self.wfile.flush()
+
+
+class _LLMServer(socketserver.UnixStreamServer):
+    # Single-threaded on purpose: llama.cpp contexts are not thread-safe,
+    # and the app only ever has one generation in flight.
+    allow_reuse_address = True
+
+    def __init__(self, socket_path: str, llm) -> None:
+        self.llm = llm
+        super().__init__(socket_path, _GenerateHandler)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Vesper LLM daemon")
+    parser.add_argument("--model", required=True, help="Path to the GGUF model file")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH, help="UNIX socket to listen on")
+    parser.add_argument("--n-gpu-layers", type=int, default=-1)
+    parser.add_argument("--n-ctx", type=int, default=4096)
+    parser.add_argument("--no-mlock", action="store_true",
+                        help="Do not pin model weights in RAM")
+    args = parser.parse_args()
+
+    try:
+        from llama_cpp import Llama
+    except Exception as e:
+        print(f"llama_cpp not available: {e}", file=sys.stderr)
+        return 1
+
+    if not os.path.exists(args.model):
+        print(f"Model not found: {args.model}", file=sys.stderr)
+        return 1
+
+    # Pay the multi-GB mmap + GPU offload exactly once, then serve forever.
+    # mlock keeps the weight pages resident for the daemon's whole lifetime.
+    llm = Llama(
+        model_path=args.model,
+        n_ctx=args.n_ctx,
+        n_gpu_layers=args.n_gpu_layers,
+        use_mmap=True,
+        use_mlock=not args.no_mlock,
+        verbose=False,
+    )
+
+    # Stale socket from a previous run would block bind().
+    try:
+        os.unlink(args.socket)
+    except FileNotFoundError:
+        pass
+
+    with _LLMServer(args.socket, llm) as server:
+        print(f"[llm_daemon] model loaded, listening on {args.socket}")
+        server.serve_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
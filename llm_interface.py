@@ -1,6 +1,13 @@
 # llm_interface.py
 from __future__ import annotations
+import json
+import logging
 import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
 from typing import Optional
 
 try:
@@ -8,12 +15,17 @@ try:
 except Exception as e:  # pragma: no cover
     Llama = None  # defer import errors until used
 
+from llm_daemon import DEFAULT_SOCKET_PATH
+
 
 class LLMInterface:
     """Thin wrapper around llama-cpp-python for simple text generation.
 
-    For Phase 1 we do a single non-streaming call with a test prompt.
-    In later phases, we can add streaming, function-calling, or chat templates.
+    Two modes:
+      - in-process (default): owns a Llama instance directly.
+      - daemon: talks to a long-lived llm_daemon.py over a UNIX socket, so the
+        multi-GB model load is paid once across app restarts. If the daemon is
+        not running it is spawned automatically.
     """
 
     def __init__(
@@ -22,39 +34,270 @@ class LLMInterface:
         n_gpu_layers: int = -1,
         n_ctx: int = 4096,
         n_threads: Optional[int] = None,
+        n_threads_batch: Optional[int] = None,
+        n_batch: int = 256,
         temperature: float = 0.7,
         top_p: float = 0.95,
+        top_k: int = 40,
+        min_p: float = 0.05,
+        repeat_penalty: float = 1.1,
+        stop: Optional[list] = None,
+        use_mmap: bool = True,
+        use_mlock: bool = True,
+        use_daemon: bool = False,
+        daemon_socket: str = DEFAULT_SOCKET_PATH,
     ) -> None:
+        self.temperature = temperature
+        self.top_p = top_p
+        # Capping top_k keeps the sampler at O(vocab log k) instead of a full
+        # vocab sort per decoded token for top-p renormalization.
+        self.top_k = top_k
+        self.min_p = min_p
+        self.repeat_penalty = repeat_penalty
+        # Decode is the dominant cost: every stop-string hit saves a full
+        # forward pass per skipped token. A triple newline means the monologue
+        # is over; there's no point decoding the rest of the budget.
+        self.stop = ["\n\n\n"] if stop is None else stop
+        self._sock_file = None
+        self._prefix_tokens: dict = {}  # stable prompt prefix -> token ids
+
+        if use_daemon:
+            self.llm = None
+            self._connect_or_spawn_daemon(model_path, daemon_socket, n_gpu_layers, n_ctx)
+            return
+
         if Llama is None:
             raise RuntimeError(
                 "llama_cpp not available. Install llama-cpp-python built for Jetson.")
         if not os.path.exists(model_path):
             raise FileNotFoundError(f"Model not found: {model_path}")
+        self._warn_if_heavy_quant(model_path)
 
-        self.temperature = temperature
-        self.top_p = top_p
+        # Leave one core for Qt/the compositor; the library default undershoots
+        # the Orin Nano's 6 cores for prefill.
+        if n_threads is None:
+            n_threads = max(1, (os.cpu_count() or 2) - 1)
+        # Prefill parallelizes across the whole batch, so it gets every core;
+        # the library's default tracks n_threads and under-uses the Orin.
+        if n_threads_batch is None:
+            n_threads_batch = os.cpu_count() or n_threads
+
+        # Pin the mmapped weights in RAM: under memory pressure the kernel will
+        # otherwise evict weight pages and decode stalls on NVMe re-reads.
+        if use_mlock:
+            use_mlock = self._raise_memlock_limit()
 
         # On Jetson Orin Nano with CUDA build, set n_gpu_layers=-1 to place all on GPU if memory allows.
-        # Adjust if you see OOMs.
+        # Adjust if you see OOMs. n_batch trades prefill throughput vs VRAM:
+        # try 128/256/512 and keep whichever measures fastest.
         self.llm = Llama(
             model_path=model_path,
             n_ctx=n_ctx,
-            n_threads=n_threads,  # None -> library default
+            n_threads=n_threads,
+            n_threads_batch=n_threads_batch,
+            n_batch=n_batch,
             n_gpu_layers=n_gpu_layers,
+            use_mmap=use_mmap,
+            use_mlock=use_mlock,
             verbose=False,
         )
 
+        self._verify_gpu_offload(n_gpu_layers)
+
+        # Prompt KV cache: persona prompts share a large stable prefix (persona +
+        # style rules + examples) with only the topic tail changing, so letting
+        # llama.cpp reuse the longest matching prefix skips most of the prefill.
+        try:
+            from llama_cpp import LlamaRAMCache  # type: ignore
+            self.llm.set_cache(LlamaRAMCache())
+        except Exception:
+            pass  # older llama-cpp-python builds; generation still works, just slower
+
+    @staticmethod
+    def _raise_memlock_limit() -> bool:
+        """Lift RLIMIT_MEMLOCK so mlock() can cover the whole model.
+
+        Returns whether mlock should still be attempted; without the limit
+        raised, llama.cpp's mlock fails partway and wastes startup time.
+        """
+        try:
+            import resource
+            resource.setrlimit(
+                resource.RLIMIT_MEMLOCK,
+                (resource.RLIM_INFINITY, resource.RLIM_INFINITY),
+            )
+            return True
+        except (ImportError, ValueError, OSError):
+            logging.getLogger(__name__).warning(
+                "Could not raise RLIMIT_MEMLOCK; loading without mlock "
+                "(weights may be evicted under memory pressure)")
+            return False
+
+    @staticmethod
+    def _verify_gpu_offload(n_gpu_layers: int) -> None:
+        """Fail fast if llama-cpp-python was built without CUDA.
+
+        A CPU-only wheel silently accepts n_gpu_layers=-1 and runs at ~1 tok/s
+        on the Jetson — the single worst silent performance cliff for this app.
+        Set ALLOW_CPU=1 to run on CPU deliberately.
+        """
+        if n_gpu_layers == 0:
+            return  # CPU explicitly requested
+        try:
+            import llama_cpp
+            info = llama_cpp.llama_print_system_info().decode("utf-8", "replace")
+        except Exception:
+            return  # can't introspect this build; don't block startup
+        if "CUDA = 1" in info or "BLAS = 1" in info:
+            return
+        msg = (
+            "llama-cpp-python was built without CUDA — generation will run on CPU. "
+            "Rebuild with: CMAKE_ARGS=\"-DLLAMA_CUBLAS=on "
+            "-DCMAKE_CUDA_ARCHITECTURES=all-major\" FORCE_CMAKE=1 "
+            "pip install --no-cache-dir --force-reinstall llama-cpp-python "
+            "(or set ALLOW_CPU=1 to run anyway)"
+        )
+        if os.environ.get("ALLOW_CPU") == "1":
+            logging.getLogger(__name__).warning(msg)
+            return
+        raise RuntimeError(msg)
+
+    @staticmethod
+    def _warn_if_heavy_quant(model_path: str) -> None:
+        # Decode on the Orin Nano is memory-bandwidth-bound: F16/Q8 weights
+        # roughly halve tok/s vs Q4_K_M for little quality gain at this size.
+        name = os.path.basename(model_path).lower()
+        if any(tag in name for tag in ("f16", "fp16", "q8")):
+            logging.getLogger(__name__).warning(
+                "Model %s looks like an F16/Q8 quant; Q4_K_M or Q5_K_S is ~2x faster "
+                "on Jetson. Convert with: llama.cpp/quantize <in>.gguf <out>.gguf Q4_K_M",
+                name,
+            )
+
+    # ----- daemon mode -----
+    def _connect_or_spawn_daemon(self, model_path: str, socket_path: str,
+                                 n_gpu_layers: int, n_ctx: int) -> None:
+        sock = self._try_connect(socket_path)
+        if sock is None:
+            # Spawn a fresh daemon; it keeps serving after this app exits.
+            daemon_script = Path(__file__).parent / "llm_daemon.py"
+            subprocess.Popen(
+                [sys.executable, str(daemon_script),
+                 "--model", model_path,
+                 "--socket", socket_path,
+                 "--n-gpu-layers", str(n_gpu_layers),
+                 "--n-ctx", str(n_ctx)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+            # Model load can take a while on a Jetson; poll until it's up.
+            deadline = time.monotonic() + 120
+            while sock is None and time.monotonic() < deadline:
+                time.sleep(0.5)
+                sock = self._try_connect(socket_path)
+        if sock is None:
+            raise RuntimeError(f"Could not reach LLM daemon on {socket_path}")
+        self._sock_file = sock.makefile("rwb")
+
+    @staticmethod
+    def _try_connect(socket_path: str):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(socket_path)
+            return sock
+        except OSError:
+            sock.close()
+            return None
+
+    def _send_request(self, prompt: str, max_tokens: int, stream: bool) -> None:
+        req = {"prompt": prompt, "max_tokens": max_tokens, "stream": stream,
+               "stop": self.stop}
+        req.update(self._sampling_kwargs())
+        self._sock_file.write((json.dumps(req) + "\n").encode("utf-8"))
+        self._sock_file.flush()
+
+    def _generate_remote(self, prompt: str, max_tokens: int) -> str:
+        self._send_request(prompt, max_tokens, stream=False)
+        reply = json.loads(self._sock_file.readline())
+        if "error" in reply:
+            raise RuntimeError(reply["error"])
+        return reply["text"].strip()
+
+    def _stream_remote(self, prompt: str, max_tokens: int):
+        self._send_request(prompt, max_tokens, stream=True)
+        while True:
+            reply = json.loads(self._sock_file.readline())
+            if "error" in reply:
+                raise RuntimeError(reply["error"])
+            if reply.get("done"):
+                return
+            yield reply["text"]
+
+    # ----- tokenization -----
+    def tokenize(self, text: str, add_bos: bool = True) -> list:
+        return self.llm.tokenize(text.encode("utf-8"), add_bos=add_bos)
+
+    def cache_prefix(self, prefix: str) -> None:
+        """Pre-tokenize a stable prompt prefix so later calls skip its BPE work.
+
+        No-op in daemon mode (tokenization happens in the daemon process).
+        """
+        if self._sock_file is None and prefix not in self._prefix_tokens:
+            self._prefix_tokens[prefix] = self.tokenize(prefix)
+
+    def _prompt_tokens_or_text(self, prompt: str):
+        """Reuse cached prefix tokens when the prompt starts with one."""
+        for prefix, toks in self._prefix_tokens.items():
+            if prompt.startswith(prefix):
+                return toks + self.tokenize(prompt[len(prefix):], add_bos=False)
+        return prompt
+
+    def _sampling_kwargs(self) -> dict:
+        if self.temperature <= 0.0:
+            # Greedy decode: top_k=1 takes the argmax path and skips the
+            # softmax + top-p/top-k renormalization work entirely.
+            return {"temperature": 0.0, "top_k": 1}
+        return {
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            "top_k": self.top_k,
+            "min_p": self.min_p,
+            "repeat_penalty": self.repeat_penalty,
+        }
+
     def generate(self, prompt: str, max_tokens: int = 256) -> str:
         """Simple text completion.
 
         If your model expects chat format, wrap the prompt accordingly (later phases).
         """
+        if self._sock_file is not None:
+            return self._generate_remote(prompt, max_tokens)
         result = self.llm(
-            prompt=prompt,
+            prompt=self._prompt_tokens_or_text(prompt),
             max_tokens=max_tokens,
-            temperature=self.temperature,
-            top_p=self.top_p,
-            stop=None,
+            stop=self.stop,
+            **self._sampling_kwargs(),
         )
         # llama-cpp returns a dict; text is under 'choices'[0]['text'] for completion API
-        return result["choices"][0]["text"].strip()
\ No newline at end of file
+        return result["choices"][0]["text"].strip()
+
+    def generate_stream(self, prompt: str, max_tokens: int = 256):
+        """Streaming text completion: yields text pieces as they are decoded.
+
+        Lets the UI show tokens as they arrive instead of idling for the
+        whole completion — time-to-first-token drops to one decode step.
+        """
+        if self._sock_file is not None:
+            yield from self._stream_remote(prompt, max_tokens)
+            return
+        for chunk in self.llm(
+            prompt=self._prompt_tokens_or_text(prompt),
+            max_tokens=max_tokens,
+            stop=self.stop,
+            stream=True,
+            **self._sampling_kwargs(),
+        ):
+            piece = chunk["choices"][0]["text"]
+            if piece:
+                yield piece
\ No newline at end of file
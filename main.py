@@ -1,19 +1,87 @@
 # main.py — endless loop + LLM-picked visible topic (Jetson-safe: 1 model, 1 worker thread)
 from __future__ import annotations
-import sys, random, re, yaml
+import logging, os, pickle, sys, random, yaml
 from pathlib import Path
-from typing import Dict, Any, List
-from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, QThread, QTimer
+from typing import Dict, Any, List, Optional
+from PyQt5.QtCore import QObject, QMetaObject, Qt, pyqtSignal, pyqtSlot, QThread, QTimer
 from PyQt5.QtWidgets import QApplication
 
 from ui_renderer import ConversationWindow
 from llm_interface import LLMInterface
 
 
+# One LLMInterface per process: model load is multi-second on a Jetson, so
+# every code path must share this instance instead of constructing its own.
+_LLM_SINGLETON: Optional[LLMInterface] = None
+
+
+def pick_n_ctx(cfg: Dict[str, Any], max_tokens: int = 700) -> int:
+    """Smallest power-of-two context that fits the largest persona prompt.
+
+    The KV cache is allocated up front proportional to n_ctx, so a blanket
+    4096 wastes hundreds of MB of unified memory the GPU layers could use.
+    An explicit top-level `n_ctx` in config.yaml overrides the estimate.
+    """
+    if cfg.get("n_ctx"):
+        return int(cfg["n_ctx"])
+    longest = max(
+        (len(build_prompt(p)) for p in cfg.get("personalities", []) or []),
+        default=2048,
+    )
+    # ~3 chars per token is a safe overestimate for English prose prompts
+    needed = longest // 3 + max_tokens + 64
+    n_ctx = 1024
+    while n_ctx < needed:
+        n_ctx *= 2
+    return min(n_ctx, 4096)
+
+
+def get_llm(cfg: Dict[str, Any]) -> LLMInterface:
+    global _LLM_SINGLETON
+    if _LLM_SINGLETON is None:
+        _LLM_SINGLETON = LLMInterface(
+            model_path=cfg.get("model_path"),
+            n_gpu_layers=-1,  # set 0 for CPU-only while debugging stability
+            n_ctx=pick_n_ctx(cfg),
+            n_threads=cfg.get("n_threads"),  # None -> cores-1
+            n_threads_batch=cfg.get("n_threads_batch"),  # None -> all cores
+            n_batch=int(cfg.get("n_batch", 256)),
+            temperature=float(cfg.get("temperature", 0.7)),  # 0 -> greedy decode
+            top_p=0.95,
+            use_mmap=bool(cfg.get("use_mmap", True)),
+            use_mlock=bool(cfg.get("use_mlock", True)),
+            use_daemon=bool(cfg.get("use_daemon", False)),
+        )
+    return _LLM_SINGLETON
+
+
 # ---------- Config helpers ----------
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml: ~10x faster parse
+except ImportError:  # pure-Python fallback
+    from yaml import SafeLoader as _YamlLoader
+
+
 def load_config(cfg_path: Path) -> dict:
-    with cfg_path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    # Kiosk deployments restart this app a lot; cache the parsed config as a
+    # pickle sidecar so warm starts do one stat() + pickle.load instead of a
+    # YAML parse. The sidecar is rebuilt whenever config.yaml is newer.
+    cache_path = cfg_path.with_suffix(".yaml.pkl")
+    try:
+        if cache_path.stat().st_mtime >= cfg_path.stat().st_mtime:
+            with cache_path.open("rb") as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass  # missing/stale/corrupt cache -> reparse
+
+    with cfg_path.open("rb") as f:
+        cfg = yaml.load(f, Loader=_YamlLoader)
+    try:
+        with cache_path.open("wb") as f:
+            pickle.dump(cfg, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # read-only filesystem; caching is best-effort
+    return cfg
 
 
 def pick_persona_sequence(cfg: Dict[str, Any], count: int) -> List[Dict[str, Any]]:
@@ -31,35 +99,122 @@ def pick_persona_sequence(cfg: Dict[str, Any], count: int) -> List[Dict[str, Any
 
     if len(all_personas) >= count:
         return random.sample(all_personas, count)
-    return [random.choice(all_personas) for _ in range(count)]
+    return random.choices(all_personas, k=count)  # with replacement, one C call
 
 
 # ---------- Prompt + chunking ----------
-def build_prompt(persona: Dict[str, Any], topic: str) -> str:
+# Every prompt starts with this exact header: a byte-identical opening means
+# llama.cpp's prefix KV cache covers these tokens across ALL personas, not
+# just repeat turns of the same one.
+SYSTEM_PREFIX = (
+    "You are playing one of several distinct characters in an endless "
+    "stream-of-consciousness performance.\n\n"
+)
+
+
+def build_prompt_prefix(persona: Dict[str, Any]) -> str:
+    """Topic-independent part of the persona prompt.
+
+    Byte-identical across topics, so llama.cpp's KV prompt cache can reuse its
+    prefill and LLMInterface can pre-tokenize it once per persona. Formatted
+    once and memoized on the persona dict — only the topic varies per turn.
+    """
+    cached = persona.get("_prefix_cache")
+    if cached is not None:
+        return cached
+
     prompt_persona = persona.get("prompt_persona", "You are a distinct voice.")
     style_rules = persona.get("style_rules", [])
     examples = persona.get("examples", [])
     display_name = persona.get("display_name", persona.get("name", "Persona"))
 
-    rules_formatted = "\n".join(f"- {r}" for r in style_rules)
-    ex_formatted = "\n".join(f"Example — {display_name}: \"{e}\"" for e in examples)
-    approx_words = int(persona.get("max_words_per_chunk", 85)) * 3
+    # Single join over flat parts: the chained f-strings allocated the two
+    # joined blocks and then recopied them into the outer buffer.
+    parts = [SYSTEM_PREFIX, prompt_persona, "\n\nStyle rules:\n"]
+    parts.extend(f"- {r}\n" for r in style_rules)
+    parts.append("\nReference tone/examples (do not repeat verbatim):\n")
+    parts.extend(f"Example — {display_name}: \"{e}\"\n" for e in examples)
+    parts.append(
+        f"\nStay fully in character as {display_name}. "
+        "Do not include stage directions or brackets.\n"
+    )
+    prefix = "".join(parts)
+    persona["_prefix_cache"] = prefix
+    return prefix
+
+
+def build_prompt(persona: Dict[str, Any]) -> str:
+    """One prompt for topic *and* body.
 
+    Asking the model to invent its own topic inline halves the prefill
+    passes per persona turn — the separate ≤50-token topic call paid the
+    same prompt-processing cost as the full monologue.
+    """
+    approx_words = int(persona.get("max_words_per_chunk", 85)) * 3
     return (
-        f"{prompt_persona}\n\n"
-        f"Style rules:\n{rules_formatted}\n\n"
-        f"Reference tone/examples (do not repeat verbatim):\n{ex_formatted}\n\n"
-        f"Write about the topic: '{topic}'. Aim for ~{approx_words} words in total.\n"
-        f"Stay fully in character as {display_name}. Do not include stage directions or brackets.\n"
+        build_prompt_prefix(persona)
+        + "First line: TOPIC: followed by a random, creative 2-6 word topic "
+        "(no quotes or other labels).\n"
+        f"Then a blank line, then write about that topic. Aim for ~{approx_words} "
+        "words in total.\n"
     )
 
 
+# Quotes/punctuation trimmed off model-emitted topics; hoisted so str.strip
+# doesn't rebuild its char set per call.
+_TOPIC_STRIP = "\"'“”‘’.,;:- "
+
+
+def split_topic_header(text: str) -> tuple:
+    """Split the 'TOPIC: <x>' first line off a combined generation.
+
+    Returns (topic or None, body). Tolerant of a model that skips the
+    header: the whole text is then treated as body.
+    """
+    first, _, rest = text.partition("\n")
+    if first.lstrip().upper().startswith("TOPIC:"):
+        topic = first.split(":", 1)[1].strip().strip(_TOPIC_STRIP)
+        return topic or None, rest.lstrip()
+    return None, text
+
+
+def _split_sentences(s: str) -> List[str]:
+    """Split on a terminator (.!?) followed by whitespace, keeping the terminator.
+
+    A plain left-to-right scan: the lookbehind regex this replaces sent the
+    engine down the general NFA path over the whole (multi-KB) LLM output,
+    and this runs repeatedly mid-decode for chunk streaming.
+    """
+    out: List[str] = []
+    start = 0
+    i = 0
+    n = len(s)
+    while i < n:
+        if s[i] in ".!?" and i + 1 < n and s[i + 1].isspace():
+            out.append(s[start:i + 1])
+            i += 1
+            while i < n and s[i].isspace():
+                i += 1
+            start = i
+        else:
+            i += 1
+    if start < n:
+        out.append(s[start:])
+    return out
+
+
 def chunk_text_by_sentences(text: str, max_words: int) -> List[str]:
     """
     Group full sentences up to ~max_words per chunk.
     If a single sentence exceeds the cap, hard-split that sentence by words.
     """
-    sentences = re.split(r'(?<=[.!?])\s+', text.strip())
+    text = text.strip()
+    # Fast path: space count is the same cheap word-count estimate the
+    # streaming worker uses; most persona turns fit in a single chunk.
+    if text.count(" ") + 1 <= max_words:
+        return [text] if text else []
+
+    sentences = _split_sentences(text)
     chunks: List[str] = []
     current: List[str] = []
     count = 0
@@ -78,12 +233,11 @@ def chunk_text_by_sentences(text: str, max_words: int) -> List[str]:
             continue
 
         if len(words) > max_words:
-            # Hard-split long sentence
+            # Hard-split long sentence. split() already stripped the words, so
+            # the joined parts need no re-strip and can never be empty.
             flush()
-            for i in range(0, len(words), max_words):
-                part = " ".join(words[i:i+max_words]).strip()
-                if part:
-                    chunks.append(part)
+            chunks.extend(" ".join(words[i:i + max_words])
+                          for i in range(0, len(words), max_words))
             continue
 
         if count + len(words) <= max_words:
@@ -98,35 +252,80 @@ def chunk_text_by_sentences(text: str, max_words: int) -> List[str]:
     return [c for c in chunks if c]
 
 
-def build_topic_prompt() -> str:
-    # Lightweight ask for a short, clean topic
-    return (
-        "Suggest exactly ONE random, creative topic for a character to muse about.\n"
-        "- Output ONLY the topic text, 2–6 words.\n"
-        "- No quotes, punctuation, labels, or explanations."
-    )
-
-
 # ---------- Worker (long-lived in one thread) ----------
 class LLMWorker(QObject):
-    finished = pyqtSignal(str)   # emits text
+    # Emit request from the GUI thread to run generate() on the worker thread:
+    # a direct slot call would execute on the caller's thread and block paint.
+    # Args: prompt, max_tokens, chunk_words (0 = don't emit chunks).
+    request = pyqtSignal(str, int, int)
+    token = pyqtSignal(str)        # emits decoded text in small batches
+    chunk_ready = pyqtSignal(str)  # emits display-sized chunks mid-decode
+    finished = pyqtSignal(str)     # emits full text
     error = pyqtSignal(str)
+    warmed = pyqtSignal()          # one-time: warmup generation done
 
     def __init__(self, llm: LLMInterface):
         super().__init__()
         self.llm = llm
 
-    @pyqtSlot(str, int)
-    def generate(self, prompt: str, max_tokens: int = 700):
+    @pyqtSlot()
+    def warmup(self):
+        # Throwaway 1-token completion over the shared system header: pays
+        # CUDA kernel JIT, cuBLAS handle init, and first KV page-in while the
+        # splash screen is up, AND leaves the header's KV entries cached so
+        # the first real prompt starts from a warm prefix.
+        try:
+            self.llm.generate(SYSTEM_PREFIX, max_tokens=1)
+        except Exception:
+            pass  # real generations will surface any persistent failure
+        self.warmed.emit()
+
+    @pyqtSlot(str, int, int)
+    def generate(self, prompt: str, max_tokens: int = 700, chunk_words: int = 0):
         try:
-            text = self.llm.generate(prompt, max_tokens=max_tokens)
-            self.finished.emit(text)
+            pieces: List[str] = []
+            unsent = 0  # pieces decoded but not yet emitted via `token`
+            pending = ""  # text not yet emitted as a chunk
+            for piece in self.llm.generate_stream(prompt, max_tokens=max_tokens):
+                pieces.append(piece)
+                unsent += 1
+                # Batch the cross-thread token signal: a queued event per
+                # decoded piece is pure Qt overhead at 20+ tok/s, and the
+                # reader can't perceive sub-half-second granularity anyway.
+                if unsent >= 8:
+                    self.token.emit("".join(pieces[-unsent:]))
+                    unsent = 0
+                if chunk_words <= 0:
+                    continue
+                pending += piece
+                # Once a full chunk's worth of words has decoded, emit every
+                # complete chunk and keep the tail — the display can start
+                # while the rest is still generating.
+                if pending.count(" ") + 1 >= chunk_words:
+                    done = chunk_text_by_sentences(pending, chunk_words)
+                    if len(done) > 1:
+                        for c in done[:-1]:
+                            self.chunk_ready.emit(c)
+                        pending = done[-1]
+            if unsent:
+                self.token.emit("".join(pieces[-unsent:]))
+            if chunk_words > 0:
+                for c in chunk_text_by_sentences(pending, chunk_words):
+                    self.chunk_ready.emit(c)
+            self.finished.emit("".join(pieces).strip())
         except Exception as e:
             self.error.emit(str(e))
 
 
 # ---------- Main ----------
 def main() -> int:
+    # Diagnostics go through logging, quiet by default: synchronous stdout
+    # writes (especially over SSH to the Jetson) can block for tens of ms
+    # before Qt's first paint. VESPER_DEBUG=1 turns the firehose back on.
+    logging.basicConfig(
+        level=logging.DEBUG if os.environ.get("VESPER_DEBUG") == "1" else logging.WARNING
+    )
+
     cfg_path = Path(__file__).parent / "config.yaml"
     cfg = load_config(cfg_path)
 
@@ -140,13 +339,7 @@ def main() -> int:
 
     # Build LLM on the MAIN THREAD (Jetson-safe)
     try:
-        llm = LLMInterface(
-            model_path=cfg.get("model_path"),
-            n_gpu_layers=-1,  # set 0 for CPU-only while debugging stability
-            n_ctx=4096,
-            temperature=0.7,
-            top_p=0.95,
-        )
+        llm = get_llm(cfg)
     except Exception as e:
         w = ConversationWindow(title=title,
                                background_path=str(Path(ui_cfg.get("startup_background", "assets/startup.png"))),
@@ -157,6 +350,14 @@ def main() -> int:
         w.show_status("Failed to initialize LLM.")
         return app.exec_()
 
+    # Pre-tokenize every persona's stable prompt prefix so the per-topic calls
+    # only pay BPE cost for the short topic tail.
+    for p in cfg.get("personalities", []) or []:
+        try:
+            llm.cache_prefix(build_prompt_prefix(p))
+        except Exception:
+            break  # tokenizer unavailable (e.g. daemon mode); not fatal
+
     # Create window once
     init_bg = str(Path(ui_cfg.get("startup_background", "assets/startup.png")))
     window = ConversationWindow(
@@ -170,12 +371,46 @@ def main() -> int:
     window.show()
     window.show_status("Starting… (ESC to quit)")
 
-    # One long-lived worker thread
+    # One long-lived worker thread, reused for every prompt; it only winds
+    # down when the app quits.
     thread = QThread()
     worker = LLMWorker(llm)
     worker.moveToThread(thread)
+    worker.request.connect(worker.generate)  # queued across threads
     thread.start()
 
+    def _stop_worker():
+        thread.quit()
+        thread.wait(2000)
+
+    app.aboutToQuit.connect(_stop_worker)
+
+    # Connect worker/window signals ONCE; each persona turn swaps its
+    # closures into this dict instead of the disconnect/reconnect dance
+    # (QObject.disconnect walks the metaobject connection lists per call,
+    # and every re-connect allocated fresh bound slots).
+    handlers: Dict[str, Any] = {}
+
+    def _dispatch(key: str):
+        def _slot(*args):
+            fn = handlers.get(key)
+            if fn is not None:
+                fn(*args)
+        return _slot
+
+    worker.finished.connect(_dispatch("finished"))
+    worker.error.connect(_dispatch("error"))
+    worker.token.connect(_dispatch("token"))
+    worker.chunk_ready.connect(_dispatch("chunk"))
+    window.chunks_finished.connect(_dispatch("chunks_finished"))
+
+    # Stuck-playback watchdog, cancelled on normal completion. A bare
+    # QTimer.singleShot can't be stopped, so each stale one would wake the
+    # event loop mid-way through some LATER persona's generation.
+    watchdog = QTimer(window)
+    watchdog.setSingleShot(True)
+    watchdog.timeout.connect(_dispatch("watchdog"))
+
     # Prepare persona sequence (endless loop will refresh this each pass)
     state = {"personas_seq": pick_persona_sequence(cfg, num_chars)}
     index = {"i": 0}
@@ -200,7 +435,7 @@ def main() -> int:
                 {"screen_width": width, "screen_height": height}
             )
         window.display_text("")  # clear
-        window.show_status(f"Persona {i+1}/{len(state['personas_seq'])}: {name} • choosing topic…")
+        window.show_status(f"Persona {i+1}/{len(state['personas_seq'])}: {name} • writing…")
 
         # Guard so proceed_next can't double-fire
         guard = {"done": False}
@@ -209,6 +444,7 @@ def main() -> int:
             if guard["done"]:
                 return
             guard["done"] = True
+            watchdog.stop()
             index["i"] += 1
             QTimer.singleShot(0, run_one)
 
@@ -219,73 +455,82 @@ def main() -> int:
             window.show_status("Error — moving to next character")
             proceed_next()
 
-        # STEP 1: Ask LLM for a random topic (visible to user)
-        def on_topic_finished(text: str):
-            # Clean topic: take first non-empty line, strip extra punctuation/quotes
-            raw = (text or "").strip()
-            topic = raw.splitlines()[0].strip().strip("\"'“”‘’.,;:- ") or "life"
-            window.show_status(f"{name}: topic chosen → {topic}")
-
-            # After a brief beat, generate persona's musings on that topic
-            def start_persona():
-                prompt = build_prompt(persona, topic)
-
-                def on_persona_finished(gen_text: str):
-                    max_words = int(persona.get("max_words_per_chunk", 85))
-                    chunks = chunk_text_by_sentences(gen_text, max_words)
-                    if not chunks:
-                        window.display_text("[Empty response]")
-                        window.show_status("No content returned — moving on…")
-                        proceed_next()
-                        return
-
-                    window.play_chunks(chunks, delay_seconds=30)
-                    window.show_status(f"{name}: showing {len(chunks)} chunks • ≤{max_words} words each")
-
-                    # Connect end-of-chunks -> next persona
-                    try:
-                        window.chunks_finished.disconnect()
-                    except Exception:
-                        pass
-                    window.chunks_finished.connect(proceed_next)
-
-                    # Fallback safety in case the signal never fires
-                    total_ms = 30_000 * max(1, len(chunks))
-                    QTimer.singleShot(total_ms + 2000, proceed_next)
-
-                # Rewire worker for persona generation
-                try:
-                    worker.finished.disconnect()
-                except Exception:
-                    pass
-                try:
-                    worker.error.disconnect()
-                except Exception:
-                    pass
-                worker.finished.connect(on_persona_finished)
-                worker.error.connect(on_error)
-
-                QTimer.singleShot(0, lambda: worker.generate(prompt, 700))
-
-            # Show the topic briefly (e.g., ~1.2s) before generating the content
-            QTimer.singleShot(1200, start_persona)
-
-        # Wire worker for topic generation first
-        try:
-            worker.finished.disconnect()
-        except Exception:
-            pass
-        try:
-            worker.error.disconnect()
-        except Exception:
-            pass
-        worker.finished.connect(on_topic_finished)
-        worker.error.connect(on_error)
+        # ONE generation per persona: the model picks its topic on the first
+        # line and writes the body after it (see build_prompt), so there is
+        # no separate topic call or between-steps beat.
+        prompt = build_prompt(persona)
+        max_words = int(persona.get("max_words_per_chunk", 85))
+
+        # Chunks stream in while decode continues: display overlaps
+        # generation instead of waiting for the full completion, and
+        # each chunk is paced by reading speed (see ConversationWindow).
+        window.begin_chunk_queue()
 
-        topic_prompt = build_topic_prompt()
-        QTimer.singleShot(0, lambda: worker.generate(topic_prompt, 50))
+        # Until the first full chunk lands, fill the balloon with raw
+        # streamed text so the first words appear at decode speed.
+        stream_state = {"buf": [], "chunking": False, "topic": None, "stripped": False}
 
-    QTimer.singleShot(0, run_one)
+        def note_topic(topic):
+            if topic and stream_state["topic"] is None:
+                stream_state["topic"] = topic
+                window.show_status(f"{name}: topic → {topic}")
+
+        def on_token(piece: str):
+            if stream_state["chunking"]:
+                return
+            stream_state["buf"].append(piece)
+            text = "".join(stream_state["buf"])
+            if stream_state["topic"] is None and "\n" not in text:
+                return  # TOPIC header still decoding; don't flash it raw
+            topic, body = split_topic_header(text)
+            note_topic(topic)
+            window.display_text(body.strip())
+
+        def on_chunk(chunk: str):
+            stream_state["chunking"] = True
+            if not stream_state["stripped"]:
+                # First chunk carries the TOPIC header; peel it off once.
+                stream_state["stripped"] = True
+                topic, chunk = split_topic_header(chunk)
+                note_topic(topic)
+                if not chunk.strip():
+                    return
+            window.queue_chunk(chunk)
+
+        def on_persona_finished(gen_text: str):
+            topic, body = split_topic_header(gen_text.strip())
+            note_topic(topic)
+            if not body.strip():
+                window.display_text("[Empty response]")
+                window.show_status("No content returned — moving on…")
+                proceed_next()
+                return
+            window.end_chunk_queue()
+            window.show_status(f"{name}: playing chunks • ≤{max_words} words each")
+
+            # End-of-chunks -> next persona
+            handlers["chunks_finished"] = proceed_next
+
+            # Fallback safety in case the signal never fires: total
+            # reading time at a slow pace, plus margin
+            total_ms = int(len(body.split()) / 100 * 60_000)
+            handlers["watchdog"] = proceed_next
+            watchdog.start(total_ms + 10_000)
+
+        # Point the standing connections at this turn's closures
+        handlers["finished"] = on_persona_finished
+        handlers["error"] = on_error
+        handlers["token"] = on_token
+        handlers["chunk"] = on_chunk
+        handlers["chunks_finished"] = None  # armed when playback completes
+
+        worker.request.emit(prompt, 700, max_words)
+
+    # Warm the model on the worker thread while the splash background shows;
+    # kick off the persona loop once the one-token warmup returns.
+    window.show_status("Warming up model… (ESC to quit)")
+    worker.warmed.connect(lambda: QTimer.singleShot(0, run_one))
+    QMetaObject.invokeMethod(worker, "warmup", Qt.QueuedConnection)
     return app.exec_()
 
 
@@ -1,13 +1,131 @@
 # ui_renderer.py — QLabel-based balloon (centered text) + fades + end-of-sequence signal + ESC to quit
 from __future__ import annotations
+import logging
+from collections import OrderedDict
 from typing import Optional, Dict, List
-from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtSignal, QEvent
-from PyQt5.QtGui import QPixmap, QFont
+from PyQt5.QtCore import (
+    Qt, QElapsedTimer, QObject, QPoint, QRect, QSize, QTimer, QRunnable,
+    QThreadPool, pyqtSignal
+)
+from PyQt5.QtGui import QImage, QImageReader, QPainter, QPixmap, QFont, QFontMetrics
 from PyQt5.QtWidgets import (
-    QMainWindow, QWidget, QLabel, QVBoxLayout, QStackedLayout, QSizePolicy,
-    QGraphicsOpacityEffect, QApplication
+    QMainWindow, QWidget, QLabel, QGraphicsOpacityEffect, QApplication
+)
+
+log = logging.getLogger(__name__)
+
+# QFont construction probes the font database; windows are cheap enough to
+# recreate that sharing resolved fonts per (family, size) is worth it.
+_FONT_CACHE: Dict[tuple, QFont] = {}
+
+# One compiled constant instead of a per-construction f-string rebuild;
+# %-interpolation fills in the three config-driven values.
+_CONTAINER_STYLE_TMPL = (
+    "QLabel#balloon { background-color: rgba(255,255,255,%s);"
+    " border: none; border-radius: %dpx; padding: 12px; }"
+    " QLabel#statusbar { background-color: rgba(0,0,0,%s);"
+    " color: white; padding: 4px; }"
 )
 
+
+def _font(family: str, point_size: int) -> QFont:
+    key = (family, point_size)
+    f = _FONT_CACHE.get(key)
+    if f is None:
+        f = QFont(family, point_size)
+        _FONT_CACHE[key] = f
+    return f
+
+
+class _BgLoaderSignals(QObject):
+    loaded = pyqtSignal(str, QImage, int)
+
+
+class _BgLoader(QRunnable):
+    """Decode a background image on a pool thread.
+
+    QImage construction (disk read + libjpeg) is thread-safe; only the
+    QPixmap conversion must happen on the GUI thread. Running the decode
+    here overlaps it with whatever the LLM worker is doing instead of
+    stalling paint and fades.
+    """
+
+    def __init__(self, path: str, signals: _BgLoaderSignals,
+                 target: QSize, gen: int) -> None:
+        super().__init__()
+        self._path = path
+        self._signals = signals
+        self._target = target
+        self._gen = gen
+
+    def run(self) -> None:
+        reader = QImageReader(self._path)
+        if self._target.isValid() and not self._target.isEmpty():
+            src = reader.size()  # header-only peek, no decode
+            if src.isValid():
+                # Decode directly at cover-the-window size: libjpeg's scaled
+                # decode is much cheaper than full decode + filter after.
+                reader.setScaledSize(
+                    src.scaled(self._target, Qt.KeepAspectRatioByExpanding))
+        # Convert to the raster engine's native format here, off the GUI
+        # thread: anything else pays a per-pixel conversion on every blit.
+        img = reader.read().convertToFormat(
+            QImage.Format_ARGB32_Premultiplied)
+        self._signals.loaded.emit(self._path, img, self._gen)
+
+
+class _Canvas(QWidget):
+    """Paints the background pixmap directly and hosts the balloon label.
+
+    One widget, one backing store: the previous QLabel + transparent
+    overlay in a StackAll layout kept two full-window layers that Qt
+    composited on every frame.
+    """
+
+    resized = pyqtSignal()
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        # The cover-fit pixmap fills every pixel, so Qt can skip the
+        # palette pre-fill and backing-store erase before each paint.
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self._pm: Optional[QPixmap] = None
+        self._message = ""
+
+    def set_pixmap(self, pm: QPixmap) -> None:
+        self._pm = pm
+        self._message = ""
+        self.update()
+
+    def set_message(self, text: str) -> None:
+        self._pm = None
+        self._message = text
+        self.update()
+
+    def paintEvent(self, ev) -> None:
+        painter = QPainter(self)
+        if self._pm is not None and not self._pm.isNull():
+            # KeepAspectRatioByExpanding overshoots one axis; center-crop.
+            # Blit only the damaged region: when just the balloon is dirty
+            # (every display_text/fade tick) the rest of the background is
+            # never sampled. Source maps 1:1, so a translate suffices.
+            dx = (self._pm.width() - self.width()) // 2
+            dy = (self._pm.height() - self.height()) // 2
+            target = ev.rect()
+            painter.drawPixmap(target, self._pm, target.translated(dx, dy))
+        else:
+            # No pixmap to guarantee coverage: fill ourselves, since the
+            # opaque-paint attributes disable Qt's automatic erase.
+            painter.fillRect(ev.rect(), self.palette().window())
+            if self._message:
+                painter.drawText(self.rect(), Qt.AlignCenter, self._message)
+
+    def resizeEvent(self, ev) -> None:
+        super().resizeEvent(ev)
+        self.resized.emit()
+
+
 class ConversationWindow(QMainWindow):
     # Emitted when the LAST chunk has finished displaying
     chunks_finished = pyqtSignal()
@@ -24,185 +142,447 @@ class ConversationWindow(QMainWindow):
 
         width = int(ui_cfg.get("screen_width", 1000))
         height = int(ui_cfg.get("screen_height", 700))
-        print(f"[DEBUG] Setting window size to {width}x{height} (design {self._design_w}x{self._design_h})")
+        log.debug("Setting window size to %dx%d (design %dx%d)",
+                  width, height, self._design_w, self._design_h)
         self.resize(width, height)
 
-        # Background
-        self._bg_label = QLabel()
-        self._bg_label.setAlignment(Qt.AlignCenter)
-        self._bg_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        # Background canvas; the balloon is a plain child so it always
+        # paints above the pixmap without a separate overlay layer.
+        self._canvas = _Canvas()
 
-        # Overlay layer to host the balloon
-        self._overlay = QWidget()
-        self._overlay.setAttribute(Qt.WA_TransparentForMouseEvents, True)
-        self._overlay.setAttribute(Qt.WA_StyledBackground, False)
-
-        # Speech balloon (white rounded rect) — QLabel for easy centering
-        self._text = QLabel(self._overlay)
+        # Speech balloon (white rounded rect) — QLabel for easy centering.
+        # Alpha comes from the rgba() stylesheet color; autofill on top of a
+        # styled background would add a second palette fill per paint.
+        self._text = QLabel(self._canvas)
         self._text.setWordWrap(True)
         self._text.setAlignment(Qt.AlignCenter)  # centers H & V
+        # Default to the plain-text layout path: AutoText would probe every
+        # chunk for markup and rich-text layout costs several times more.
+        self._text.setTextFormat(Qt.PlainText)
+        self._text_is_plain = True
         self._text.setAttribute(Qt.WA_StyledBackground, True)
-        self._text.setAutoFillBackground(True)
 
-        # Fade effect
-        self._opacity = QGraphicsOpacityEffect(self._text)
-        self._text.setGraphicsEffect(self._opacity)
-        self._opacity.setOpacity(1.0)
-        self._fade = QPropertyAnimation(self._opacity, b"opacity", self)
-        self._fade.setEasingCurve(QEasingCurve.InOutQuad)
-        self._fade.setDuration(800)
+        # Fade effect. Optional: QGraphicsOpacityEffect re-renders the
+        # balloon into an offscreen buffer every animation frame, which a
+        # low-power target may rather skip — ui.enable_fades: false swaps
+        # chunks directly with no effect at all.
+        self._fades_enabled = bool(ui_cfg.get("enable_fades", True))
+        # Opt-in alternative: promote the balloon to a frameless translucent
+        # tool window and fade via setWindowOpacity, which the compositor
+        # blends on the GPU instead of re-rendering the label in software.
+        # Off by default — needs a compositor honoring per-window opacity.
+        self._composited_fades = (self._fades_enabled and
+                                  bool(ui_cfg.get("composited_fades", False)))
+        self._opacity = None
+        if self._composited_fades:
+            self._balloon_win = QWidget(self, Qt.Tool | Qt.FramelessWindowHint)
+            self._balloon_win.setAttribute(Qt.WA_TranslucentBackground, True)
+            self._text.setParent(self._balloon_win)
+        elif self._fades_enabled:
+            self._opacity = QGraphicsOpacityEffect(self._text)
+            self._text.setGraphicsEffect(self._opacity)
+            self._opacity.setOpacity(1.0)
+        self._balloon_opacity = 1.0
+        # One coarse timer + clock drives both fade directions, replacing
+        # QPropertyAnimation and its per-cycle finished-signal hops. 30 fps
+        # is plenty for a 400 ms opacity ramp, and each skipped tick is one
+        # fewer offscreen re-render of the balloon.
+        self._fade_ms = 400
+        self._fade_phase = "idle"   # "idle" | "out" | "in"
+        self._fade_from = 1.0
+        self._fade_tick = QTimer(self)
+        self._fade_tick.setInterval(33)
+        self._fade_tick.timeout.connect(self._fade_step)
+        self._fade_clock = QElapsedTimer()
 
-        # Styling
+        # Styling: both labels are styled by ONE stylesheet on the container
+        # (set after layout below) — Qt parses CSS per setStyleSheet call, so
+        # two per-widget sheets meant two parses and two style resolutions.
         opacity = float(ui_cfg.get("text_box_opacity", 0.92))
         rounding = int(ui_cfg.get("text_box_rounding", 15))
-        self._text.setStyleSheet(
-            f"QLabel {{ background-color: rgba(255,255,255,{opacity});"
-            f" border: none; border-radius: {rounding}px; padding: 12px; }}"
-        )
-        font = QFont(ui_cfg.get("font_family", "DejaVu Sans"), int(ui_cfg.get("font_point_size", 16)))
+        self._text.setObjectName("balloon")
+        font = _font(ui_cfg.get("font_family", "DejaVu Sans"), int(ui_cfg.get("font_point_size", 16)))
         self._text.setFont(font)
 
         # Balloon geometry
         self._balloon = balloon_cfg or {"x_pos": 100, "y_pos": 100, "width": int(width * 0.6), "height": int(height * 0.4)}
+        self._last_balloon_geom = None
+        self._refresh_balloon_values()
 
         # Status bar
         self._status_label = QLabel("Ready")
-        s_font = QFont(ui_cfg.get("font_family", "DejaVu Sans"),
+        s_font = _font(ui_cfg.get("font_family", "DejaVu Sans"),
                        int(ui_cfg.get("status_font_point_size", ui_cfg.get("font_point_size", 10))))
         self._status_label.setFont(s_font)
         s_opacity = float(ui_cfg.get("status_opacity", 0.8))
-        self._status_label.setStyleSheet(
-            f"QLabel {{ background-color: rgba(0,0,0,{s_opacity}); color: white; padding: 4px; }}"
-        )
+        self._status_label.setObjectName("statusbar")
+        # Plain text (no rich-text probing) and a fixed height so a long
+        # message can't shift the manually-placed canvas above it.
+        self._status_label.setTextFormat(Qt.PlainText)
+        self._status_label.setFixedHeight(QFontMetrics(s_font).height() + 8)
 
-        # Layout
-        self._stacked_host = QWidget()
-        self._stacked = QStackedLayout(self._stacked_host)
-        self._stacked.setStackingMode(QStackedLayout.StackAll)
-        self._stacked.addWidget(self._bg_label)
-        self._stacked.addWidget(self._overlay)
+        # Status updates arrive in sub-second bursts during generation;
+        # coalesce them so at most ~10 relayouts/s hit the label.
+        self._pending_status: Optional[str] = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(self._flush_status)
 
+        # Layout: the composition is static — canvas fills the window with
+        # the fixed-height status strip below — so children are placed by
+        # hand in _do_resize instead of running Qt's layout solver per
+        # resize.
         container = QWidget()
-        outer = QVBoxLayout(container)
-        outer.setContentsMargins(0, 0, 0, 0)
-        outer.addWidget(self._stacked_host, 1)
-        outer.addWidget(self._status_label, 0)
+        self._canvas.setParent(container)
+        self._status_label.setParent(container)
+        container.setStyleSheet(
+            _CONTAINER_STYLE_TMPL % (opacity, rounding, s_opacity))
+        if self._composited_fades:
+            # The balloon window sits outside the container's stylesheet
+            # scope; reuse the same sheet (the statusbar selector simply
+            # matches nothing there).
+            self._balloon_win.setStyleSheet(
+                _CONTAINER_STYLE_TMPL % (opacity, rounding, s_opacity))
         self.setCentralWidget(container)
 
-        # Background init
+        # Background init. Resizes arrive in storms (window creation, drag-
+        # resize); debounce them and cache the scaled result so the O(W*H)
+        # smooth rescale runs once per settled size, not per event.
         self._background_path = background_path
-        self._pixmap = QPixmap(self._background_path)
-        self._bg_label.installEventFilter(self)
-        self._update_background()
+        self._pixmap = QPixmap()
+        # Personas repeat across passes; keep the last few pre-scaled
+        # backgrounds so a repeat skips the disk read + JPEG decode.
+        self._bg_cache: "OrderedDict[str, QPixmap]" = OrderedDict()
+        self._bg_pending: Optional[str] = None
+        self._bg_gen = 0  # monotonically increasing; rejects stale loads
+        self._bg_signals = _BgLoaderSignals()
+        self._bg_signals.loaded.connect(self._on_bg_loaded)
+        # Keyed on (path, w, h): toggling between a couple of window sizes
+        # (e.g. fullscreen <-> windowed) round-trips without re-filtering.
+        self._scaled_cache: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+        self._bg_applied_key = None   # what the label currently shows
+        self._bg_dirty = True         # force first apply / source swap
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self._update_background)
+        self._resize_pending = False  # one _do_resize per event-queue drain
+        self._canvas.resized.connect(self._schedule_resize)
+        self.set_background(background_path)
 
-        # Chunk playback state
-        self._chunks: List[str] = []
-        self._chunk_idx = 0
-        self._chunk_delay_ms = 20000
+        # Chunk playback state: a queue fed either all at once (play_chunks)
+        # or incrementally while the LLM is still decoding (queue_chunk).
+        # Each chunk stays up for a reading-speed-based delay, not a fixed 30 s.
+        self._queue: List[str] = []
+        self._queue_done = False
+        self._showing = False
+        self._delay_done = False
+        self._wpm = int(ui_cfg.get("reading_wpm", 160))
         self._delay_timer = QTimer(self)
         self._delay_timer.setSingleShot(True)
         self._delay_timer.timeout.connect(self._on_delay_elapsed)
 
-        self._fading_out = False
-        self._fade.finished.connect(self._on_fade_finished)
+
+        self._last_text: Optional[str] = None  # skip re-layout of identical text
+        self._paused = False          # playback halted while hidden/minimized
+        self._paused_remaining = 0    # unexpired hold time at pause, ms
 
     # --- Geometry helpers ---
+    def _refresh_balloon_values(self):
+        # Pre-extract once per balloon change so the per-resize path below
+        # is pure arithmetic with no dict lookups.
+        b = self._balloon
+        self._balloon_vals = (int(b.get("x_pos", 0)), int(b.get("y_pos", 0)),
+                              int(b.get("width", 300)), int(b.get("height", 200)))
+        self._last_balloon_geom = None
+
     def _apply_balloon_geometry(self):
-        w = max(self.width(), 1)
-        h = max(self.height(), 1)
-        sx = w / float(self._design_w)
-        sy = h / float(self._design_h)
-        bx = int(self._balloon.get("x_pos", 0) * sx)
-        by = int(self._balloon.get("y_pos", 0) * sy)
-        bw = int(self._balloon.get("width", 300) * sx)
-        bh = int(self._balloon.get("height", 200) * sy)
-        self._text.setGeometry(bx, by, bw, bh)
-        self._text.raise_()
+        sx = max(self.width(), 1) / float(self._design_w)
+        sy = max(self.height(), 1) / float(self._design_h)
+        x0, y0, w0, h0 = self._balloon_vals
+        geom = (int(x0 * sx), int(y0 * sy), int(w0 * sx), int(h0 * sy))
+        if geom == self._last_balloon_geom:
+            return  # scale settled between pixel-level resize events
+        self._last_balloon_geom = geom
+        if self._composited_fades:
+            x, y, w, h = geom
+            self._balloon_win.setGeometry(
+                QRect(self.mapToGlobal(QPoint(x, y)), QSize(w, h)))
+            self._text.setGeometry(0, 0, w, h)
+        else:
+            self._text.setGeometry(*geom)
+            self._text.raise_()
 
     def set_balloon(self, balloon_cfg: Dict[str, int], design_size: Dict[str, int]) -> None:
         self._balloon = balloon_cfg or self._balloon
         self._design_w = int(design_size.get("screen_width", self._design_w))
         self._design_h = int(design_size.get("screen_height", self._design_h))
+        self._refresh_balloon_values()
         QTimer.singleShot(0, self._apply_balloon_geometry)
 
     def showEvent(self, event):
         super().showEvent(event)
         QTimer.singleShot(0, self._apply_balloon_geometry)
+        QTimer.singleShot(0, self._update_background)
+        if self._composited_fades:
+            self._balloon_win.show()
+        if self._paused:
+            self._paused = False
+            if self._delay_done:
+                self._maybe_advance()
+            elif self._showing:
+                self._delay_timer.start(max(self._paused_remaining, 1))
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if self._composited_fades:
+            self._balloon_win.hide()
+        # Nobody is watching a minimized kiosk: halt fade ticks and the hold
+        # timer instead of animating into an occluded backing store.
+        if not self._showing:
+            return
+        self._paused = True
+        self._paused_remaining = (max(self._delay_timer.remainingTime(), 0)
+                                  if self._delay_timer.isActive() else 0)
+        self._delay_timer.stop()
+        self._fade_tick.stop()
+        if self._fade_phase != "idle":
+            # Snap the in-flight transition: resume will advance (the hold
+            # was over) or simply show the settled chunk.
+            self._fade_phase = "idle"
+            self._set_balloon_opacity(1.0)
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self._apply_balloon_geometry()
+        self._schedule_resize()
 
-    def eventFilter(self, obj, event):
-        if obj is self._bg_label and event.type() == QEvent.Resize:
-            self._update_background()
-        return super().eventFilter(obj, event)
+    def moveEvent(self, event):
+        super().moveEvent(event)
+        if self._composited_fades:
+            self._last_balloon_geom = None  # global position changed
+            self._apply_balloon_geometry()
+
+    def _schedule_resize(self):
+        # Window resize and canvas resize land as separate events in the
+        # same burst; run ONE combined handler after the queue drains.
+        if self._resize_pending:
+            return
+        self._resize_pending = True
+        QTimer.singleShot(0, self._do_resize)
+
+    def _do_resize(self):
+        self._resize_pending = False
+        # Two setGeometry calls replace the old QVBoxLayout pass.
+        w = max(self.width(), 1)
+        h = max(self.height(), 1)
+        sh = self._status_label.height()  # fixed at construction
+        self._canvas.setGeometry(0, 0, w, h - sh)
+        self._status_label.setGeometry(0, h - sh, w, sh)
+        self._apply_balloon_geometry()
+        # Cheap nearest-neighbor re-fit tracks the drag immediately; the
+        # debounced pass below redoes it smoothly once the size settles.
+        if not self._pixmap.isNull():
+            size = self._canvas.size()
+            if size.width() > 0 and size.height() > 0:
+                self._canvas.set_pixmap(self._pixmap.scaled(
+                    size, Qt.KeepAspectRatioByExpanding, Qt.FastTransformation))
+        self._resize_timer.start(50)
 
     def _update_background(self):
         if self._pixmap.isNull():
-            self._bg_label.setText("(background not found)")
+            if self._bg_pending is None:
+                self._canvas.set_message("(background not found)")
             return
-        size = self._bg_label.size()
+        if not self.isVisible() or self.isMinimized():
+            return  # showEvent re-applies once we're actually painted
+        size = self._canvas.size()
         if size.width() <= 0 or size.height() <= 0:
             return
-        scaled = self._pixmap.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-        self._bg_label.setPixmap(scaled)
-        self._overlay.raise_()
-        self._text.raise_()
+        key = (self._background_path, size.width(), size.height())
+        if self._bg_dirty:
+            self._scaled_cache.pop(key, None)  # source pixels changed
+        elif key == self._bg_applied_key:
+            return  # layout settling re-sends the same size; nothing to do
+        scaled = self._scaled_cache.get(key)
+        if scaled is not None:
+            self._scaled_cache.move_to_end(key)
+        else:
+            # One smooth pass per settled size; intermediate drag sizes only
+            # ever get the fast re-fit from eventFilter.
+            scaled = self._pixmap.scaled(
+                size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+            self._scaled_cache[key] = scaled
+            while len(self._scaled_cache) > 4:
+                self._scaled_cache.popitem(last=False)
+        self._canvas.set_pixmap(scaled)
+        self._bg_applied_key = key
+        self._bg_dirty = False
 
     def set_background(self, path: str) -> None:
         self._background_path = path
-        self._pixmap = QPixmap(self._background_path)
+        pm = self._bg_cache.get(path)
+        if pm is not None:
+            self._bg_cache.move_to_end(path)
+            self._apply_background(pm)
+            return
+        # Decode off the GUI thread; the old background stays up until the
+        # new one lands, so the swap hides behind LLM latency.
+        self._bg_pending = path
+        self._bg_gen += 1
+        QThreadPool.globalInstance().start(
+            _BgLoader(path, self._bg_signals, self.size(), self._bg_gen))
+
+    def _on_bg_loaded(self, path: str, img: QImage, gen: int) -> None:
+        pm = QPixmap.fromImage(img)
+        if not pm.isNull() and self.width() > 0 and self.height() > 0:
+            # Normally the reader already decoded at cover-the-window size;
+            # this only runs if the scaled decode was unavailable (or the
+            # window changed size mid-load).
+            want = pm.size().scaled(self.size(), Qt.KeepAspectRatioByExpanding)
+            if pm.size() != want:
+                pm = pm.scaled(self.size(), Qt.KeepAspectRatioByExpanding,
+                               Qt.SmoothTransformation)
+        self._bg_cache[path] = pm
+        while len(self._bg_cache) > 8:
+            self._bg_cache.popitem(last=False)
+        if gen != self._bg_gen:
+            return  # a later set_background superseded this load
+        self._bg_pending = None
+        self._apply_background(pm)
+
+    def _apply_background(self, pm: QPixmap) -> None:
+        self._pixmap = pm
+        self._bg_dirty = True
         self._update_background()
 
+    def _set_balloon_opacity(self, value: float) -> None:
+        self._balloon_opacity = value
+        if self._composited_fades:
+            self._balloon_win.setWindowOpacity(value)
+        elif self._opacity is not None:
+            self._opacity.setOpacity(value)
+
     def clear_text(self) -> None:
+        self._last_text = ""
         self._text.setText("")
-        if self._text.graphicsEffect():
-            self._text.graphicsEffect().setOpacity(1.0)
+        self._set_balloon_opacity(1.0)
+
+    def _use_plain_format(self, plain: bool) -> None:
+        if plain != self._text_is_plain:
+            self._text_is_plain = plain
+            self._text.setTextFormat(Qt.PlainText if plain else Qt.AutoText)
 
     def display_text(self, html_or_text: str) -> None:
-        # QLabel supports simple HTML; keep it plain unless you need markup
+        # QLabel supports simple HTML; keep it plain unless you need markup.
+        # Streaming re-pushes the whole transcript per batch, so identical
+        # updates (e.g. whitespace-only tail) skip the QLabel re-layout.
+        if html_or_text == self._last_text:
+            return
+        self._last_text = html_or_text
+        # One find() pair instead of letting AutoText probe per setText.
+        lt = html_or_text.find("<")
+        self._use_plain_format(lt == -1 or html_or_text.find(">", lt + 1) == -1)
         self._text.setText(html_or_text)
 
     # === Chunked playback API ===
     def play_chunks(self, chunks: List[str], delay_seconds: int = 30) -> None:
-        """Begin showing chunks sequentially. Shows first chunk immediately,
-        waits delay_seconds, fades out, swaps text, fades in, repeats.
-        """
-        if not chunks:
-            # Nothing to show; still notify completion so controller can loop
-            self.chunks_finished.emit()
+        """Show pre-chunked text sequentially, paced by reading speed."""
+        self.begin_chunk_queue()
+        for c in chunks:
+            self.queue_chunk(c)
+        self.end_chunk_queue()
+
+    def begin_chunk_queue(self) -> None:
+        """Reset playback for a new sequence; chunks may arrive incrementally."""
+        self._delay_timer.stop()
+        self._fade_tick.stop()
+        self._fade_phase = "idle"
+        self._queue = []
+        self._queue_done = False
+        self._showing = False
+
+    def queue_chunk(self, text: str) -> None:
+        """Append one chunk; shows immediately if nothing is on screen."""
+        if not text:
             return
-        self._chunks = chunks
-        self._chunk_idx = 0
-        self._chunk_delay_ms = max(1, delay_seconds) * 1000
-        self._opacity.setOpacity(1.0)
-        self._text.setText(self._chunks[self._chunk_idx])
-        self._delay_timer.start(self._chunk_delay_ms)
-        print(f"[DEBUG] play_chunks: total={len(chunks)} delay={delay_seconds}s")
+        self._queue.append(text)
+        if not self._showing:
+            # First chunk of the sequence: show immediately, no fade.
+            self._showing = True
+            self._set_balloon_opacity(1.0)
+            self._show_next_chunk(fade_in=False)
+        else:
+            self._maybe_advance()
+
+    def end_chunk_queue(self) -> None:
+        """No more chunks will arrive; finish once the queue drains."""
+        self._queue_done = True
+        if not self._showing and not self._queue:
+            self.chunks_finished.emit()
+        else:
+            self._maybe_advance()
+
+    def _delay_ms_for(self, text: str) -> int:
+        """How long a chunk stays up: its word count at reading speed."""
+        if self._wpm <= 0:
+            return 30_000
+        ms = int(len(text.split()) / self._wpm * 60_000)
+        return max(8_000, min(60_000, ms))
+
+    def _show_next_chunk(self, fade_in: bool) -> None:
+        text = self._queue.pop(0)
+        self._last_text = text
+        self._use_plain_format(True)  # chunks are always plain prose
+        self._text.setText(text)
+        self._delay_done = False
+        self._delay_timer.start(self._delay_ms_for(text))
+        if fade_in and self._fades_enabled:
+            self._set_balloon_opacity(0.0)
+            self._start_fade("in")
 
     def _on_delay_elapsed(self):
-        self._fading_out = True
-        self._fade.stop()
-        self._fade.setStartValue(self._opacity.opacity())
-        self._fade.setEndValue(0.0)
-        self._fade.start()
-
-    def _on_fade_finished(self):
-        if self._fading_out:
-            self._chunk_idx += 1
-            if self._chunk_idx >= len(self._chunks):
-                self.chunks_finished.emit()
+        self._delay_done = True
+        self._maybe_advance()
+
+    def _maybe_advance(self):
+        # Transition only when the current chunk's time is up and we either
+        # have a successor or know the sequence is over.
+        if not self._showing or not self._delay_done or self._fade_phase == "out":
+            return
+        if self._queue or self._queue_done:
+            if not self._fades_enabled:
+                self._advance_now()
                 return
-            self._text.setText(self._chunks[self._chunk_idx])
-            self._fading_out = False
-            self._fade.stop()
-            self._fade.setStartValue(0.0)
-            self._fade.setEndValue(1.0)
-            self._fade.start()
-        else:
-            if self._chunk_idx < len(self._chunks) - 1:
-                self._delay_timer.start(self._chunk_delay_ms)
+            self._start_fade("out")
+
+    def _start_fade(self, phase: str) -> None:
+        # An "out" can pre-empt a still-running "in"; start from the current
+        # opacity so there is no visible jump.
+        self._fade_phase = phase
+        self._fade_from = self._balloon_opacity if phase == "out" else 0.0
+        self._fade_clock.start()
+        self._fade_tick.start()
+
+    def _fade_step(self):
+        t = self._fade_clock.elapsed() / float(self._fade_ms)
+        if t >= 1.0:
+            self._fade_tick.stop()
+            phase, self._fade_phase = self._fade_phase, "idle"
+            if phase == "out":
+                self._set_balloon_opacity(0.0)
+                self._advance_now()
+            else:
+                self._set_balloon_opacity(1.0)
+            return
+        self._set_balloon_opacity(self._fade_from * (1.0 - t)
+                                  if self._fade_phase == "out" else t)
+
+    def _advance_now(self):
+        """Move to the successor chunk (or finish) with no transition left."""
+        if self._queue:
+            self._show_next_chunk(fade_in=self._fades_enabled)
+        elif self._queue_done:
+            self._showing = False
+            self.chunks_finished.emit()
 
     # ESC quits
     def keyPressEvent(self, event):
@@ -212,4 +592,14 @@ class ConversationWindow(QMainWindow):
             super().keyPressEvent(event)
 
     def show_status(self, message: str) -> None:
+        # Keep only the newest message; the coalescing timer flushes it so
+        # bursts of updates cost at most one relayout per 100 ms.
+        self._pending_status = message
+        if not self._status_timer.isActive():
+            self._status_timer.start(100)
+
+    def _flush_status(self) -> None:
+        message, self._pending_status = self._pending_status, None
+        if message is None or self._status_label.text() == message:
+            return  # dropped or identical re-announcement
         self._status_label.setText(message)